@@ -1,11 +1,79 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from wordcloud import WordCloud
-from collections import Counter
+import pyarrow as pa
+import functools
+import os
+import tempfile
 import re
-from datetime import datetime
+from collections import Counter
+from pathlib import Path
+from pandas.api.types import union_categoricals
+
+# Only the columns used by the analysis are parsed from metadata.csv
+LOAD_COLUMNS = ['title', 'abstract', 'publish_time', 'journal', 'source_x']
+CHUNK_SIZE = 200_000
+
+# Bump whenever cleaning changes, so Parquet caches from older cleaning are not reused
+CLEAN_VERSION = 2
+
+# Common words left out of word frequency counts
+STOP_WORDS = frozenset({
+    'the', 'and', 'of', 'in', 'to', 'a', 'for', 'with', 'on', 'by',
+    'as', 'an', 'from', 'that', 'this', 'is', 'are', 'was', 'were',
+    'be', 'has', 'have', 'had', 'but', 'not', 'at', 'which', 'or',
+    'it', 'its', 'their', 'they', 'them', 'these', 'those', 'such'
+})
+
+# Free-text columns stored as Arrow-backed strings
+TEXT_COLUMNS = ['title', 'abstract']
+
+# Compact dtypes for numeric columns derived during cleaning
+NUMERIC_DTYPES = {'publication_year': 'Int16', 'abstract_word_count': 'int32'}
+
+# Low-cardinality text columns stored as categoricals
+CATEGORY_COLUMNS = ['journal', 'source_x', 'journal_clean']
+
+def _cached(method):
+    """
+    Memoize an analyzer method on its arguments until the cleaned data changes
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.df_clean is None:
+            return method(self, *args, **kwargs)
+        
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return self._cache[key]
+    return wrapper
+
+def _count_words(values):
+    """
+    Count words in an Arrow string array the way str.split() does
+    
+    str.split() on the Python strings measured faster than the Arrow regex
+    and split kernels, and it handles Unicode whitespace exactly.
+    
+    >>> sample = ['a\\xa0b  c', ' x\\u2009y\\x1cz ', '']
+    >>> _count_words(pa.array(sample)).tolist() == [len(s.split()) for s in sample]
+    True
+    """
+    return np.fromiter(
+        map(len, map(str.split, values.to_pylist())),
+        dtype=NUMERIC_DTYPES['abstract_word_count'],
+        count=len(values)
+    )
+
+def _safe_groupby(df, keys):
+    """
+    Group by columns that may be categorical
+    
+    Grouping a categorical with observed=False builds a group for every
+    combination of categories, including unused ones, which is very slow
+    on journal_clean and source_x. Use this for any aggregation.
+    """
+    return df.groupby(keys, observed=True, sort=False)
 
 class CORD19Analyzer:
     def __init__(self, file_path='data/metadata.csv'):
@@ -18,19 +86,88 @@ class CORD19Analyzer:
         self.file_path = file_path
         self.df = None
         self.df_clean = None
+        # Identifies the loaded data, e.g. for caches shared across sessions
+        self.data_version = None
+        self._cache = {}
+        self._word_counts = {}
+        self._journal_counts = None
+        self._source_counts = None
         
     def load_data(self):
         """
-        Load the CORD-19 metadata file
+        Load the CORD-19 metadata file in chunks, cleaning each chunk as it is read
+        
+        The cleaned data is cached next to the CSV as Parquet and reused
+        while it is newer than the CSV and was written by the current
+        CLEAN_VERSION.
         """
         try:
-            self.df = pd.read_csv(self.file_path)
+            csv_path = Path(self.file_path)
+            cache_path = csv_path.with_suffix(f'.clean-v{CLEAN_VERSION}.parquet')
+            
+            if cache_path.exists() and cache_path.stat().st_mtime > csv_path.stat().st_mtime:
+                self.df_clean = pd.read_parquet(cache_path)
+                
+                # Parquet may not restore the Arrow string storage
+                for column in TEXT_COLUMNS:
+                    self.df_clean[column] = self.df_clean[column].astype('string[pyarrow]')
+            else:
+                reader = pd.read_csv(
+                    csv_path,
+                    usecols=LOAD_COLUMNS,
+                    dtype={'journal': 'category', 'source_x': 'category'},
+                    chunksize=CHUNK_SIZE
+                )
+                chunks = [self._clean_chunk(chunk) for chunk in reader]
+                
+                # Chunks end up with different categories, which concat would turn back into
+                # strings for every row, so give each column the union of its categories first
+                for column in CATEGORY_COLUMNS:
+                    categories = union_categoricals(
+                        [pd.Categorical(chunk[column].cat.categories) for chunk in chunks]
+                    ).categories
+                    for chunk in chunks:
+                        chunk[column] = chunk[column].cat.set_categories(categories)
+                
+                self.df_clean = pd.concat(chunks, copy=False)
+                
+                self._save_cache(cache_path)
+            
+            self.df = self.df_clean
+            self.data_version = csv_path.stat().st_mtime
+            self._reset_caches()
             print(f"Data loaded successfully: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
             return True
         except Exception as e:
             print(f"Error loading data: {e}")
             return False
     
+    def _save_cache(self, cache_path):
+        """
+        Write the cleaned data to Parquet so later startups can skip the CSV
+        
+        The file is written under a temporary name and moved into place, so
+        other sessions never read a half-written cache.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.parquet.tmp')
+        os.close(fd)
+        try:
+            self.df_clean.to_parquet(tmp_path, compression='zstd')
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Could not write data cache: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _reset_caches(self):
+        """
+        Drop results computed from a previous version of the cleaned data
+        """
+        self._cache.clear()
+        self._word_counts.clear()
+        self._journal_counts = None
+        self._source_counts = None
+    
     def explore_data(self):
         """
         Perform basic data exploration
@@ -49,44 +186,72 @@ class CORD19Analyzer:
         
         return exploration_results
     
-    def clean_data(self):
+    def _clean_chunk(self, chunk):
         """
-        Clean and prepare the data for analysis
+        Clean a single chunk of metadata rows
         """
-        if self.df is None:
-            print("Please load data first")
-            return None
-        
-        # Create a copy for cleaning
-        self.df_clean = self.df.copy()
-        
         # Handle missing values
         # Keep papers that have at least title or abstract
-        self.df_clean = self.df_clean.dropna(subset=['title'], how='all')
+        # Copy so the column assignments below do not write into a view of the raw chunk
+        chunk = chunk.dropna(subset=['title'], how='all').copy()
+        
+        for column in TEXT_COLUMNS:
+            chunk[column] = chunk[column].astype('string[pyarrow]')
         
         # Fill missing abstracts with empty string
-        self.df_clean['abstract'] = self.df_clean['abstract'].fillna('')
+        chunk['abstract'] = chunk['abstract'].fillna('')
         
         # Convert publish_time to datetime
-        self.df_clean['publish_time'] = pd.to_datetime(
-            self.df_clean['publish_time'], errors='coerce'
-        )
+        # An explicit format keeps pandas from guessing one per chunk, since dates mix '2020' and '2020-03-15'
+        chunk['publish_time'] = pd.to_datetime(chunk['publish_time'], format='ISO8601', errors='coerce')
         
         # Extract year from publication date
-        self.df_clean['publication_year'] = self.df_clean['publish_time'].dt.year
+        chunk['publication_year'] = chunk['publish_time'].dt.year.astype(NUMERIC_DTYPES['publication_year'])
         
         # Create abstract word count
-        self.df_clean['abstract_word_count'] = self.df_clean['abstract'].apply(
-            lambda x: len(str(x).split())
+        chunk['abstract_word_count'] = _count_words(pa.array(chunk['abstract'].array))
+        
+        # Clean journal names once per distinct journal rather than once per paper
+        journals = chunk['journal'].astype('category')
+        names = journals.cat.categories.astype(str).str.strip().str.title().append(pd.Index(['Unknown']))
+        # Cleaning can merge names that only differed in case or spacing, so map every
+        # original category onto the unique cleaned names; missing journals have code -1,
+        # which picks the trailing 'Unknown'
+        clean_names = names.unique()
+        code_map = clean_names.get_indexer(names)
+        chunk['journal_clean'] = pd.Categorical.from_codes(
+            code_map[journals.cat.codes.to_numpy()], categories=clean_names
         )
         
-        # Clean journal names
-        self.df_clean['journal_clean'] = self.df_clean['journal'].fillna('Unknown')
-        self.df_clean['journal_clean'] = self.df_clean['journal_clean'].str.strip().str.title()
+        # Drop categories that only appeared on untitled rows (or an unused 'Unknown'),
+        # so journal and source counts never report zero-paper entries
+        for column in CATEGORY_COLUMNS:
+            chunk[column] = chunk[column].astype('category').cat.remove_unused_categories()
+        
+        return chunk
+    
+    def clean_data(self):
+        """
+        Clean and prepare the data for analysis
+        """
+        if self.df is None:
+            print("Please load data first")
+            return None
+        
+        # load_data already cleans every chunk as it is read
+        if self.df_clean is None:
+            self.df_clean = self._clean_chunk(self.df.copy())
+            self._reset_caches()
+        
+        # Flag text columns that would be cheaper as categoricals (and grouped with _safe_groupby)
+        for column in self.df_clean.select_dtypes(include='object').columns:
+            if self.df_clean[column].nunique() < 0.05 * len(self.df_clean):
+                print(f"Column '{column}' has few distinct values, consider storing it as a category")
         
         print(f"Data cleaned: {self.df_clean.shape[0]} rows remaining")
         return self.df_clean
     
+    @_cached
     def analyze_publications_over_time(self):
         """
         Analyze publication trends over time
@@ -95,12 +260,11 @@ class CORD19Analyzer:
             print("Please clean data first")
             return None
         
-        # Remove papers with invalid years
-        valid_years = self.df_clean.dropna(subset=['publication_year'])
-        valid_years = valid_years[valid_years['publication_year'] >= 2019]
-        valid_years = valid_years[valid_years['publication_year'] <= 2023]
+        # Remove papers with invalid years (missing years compare as NA)
+        years = self.df_clean['publication_year']
+        valid_years = years[years.between(2019, 2023).fillna(False)]
         
-        publications_by_year = valid_years['publication_year'].value_counts().sort_index()
+        publications_by_year = valid_years.astype('int16').value_counts(sort=False).sort_index()
         
         return publications_by_year
     
@@ -112,9 +276,20 @@ class CORD19Analyzer:
             print("Please clean data first")
             return None
         
-        top_journals = self.df_clean['journal_clean'].value_counts().head(top_n)
+        # Count once and serve every top_n from the sorted counts
+        if self._journal_counts is None:
+            self._journal_counts = self.df_clean['journal_clean'].value_counts()
+        
+        top_journals = self._journal_counts.head(top_n)
         return top_journals
     
+    def _joined_text(self, column):
+        """
+        Join all non-missing values of a text column into one string
+        """
+        # The text columns are already Arrow strings, so no astype is needed
+        return self.df_clean[column].dropna().str.cat(sep=' ')
+    
     def analyze_word_frequencies(self, column='title', top_n=20):
         """
         Analyze most frequent words in titles or abstracts
@@ -123,26 +298,31 @@ class CORD19Analyzer:
             print("Please clean data first")
             return None
         
-        # Combine all text
-        all_text = ' '.join(self.df_clean[column].dropna().astype(str))
+        # The full counts are kept per column, so any top_n is served without recounting
+        word_freq = self._word_counts.get(column)
+        if word_freq is not None:
+            return dict(word_freq.most_common(top_n))
+        
+        # Combine all text; one regex pass over a single string measured faster
+        # than tokenizing row by row with str.findall().explode()
+        all_text = self._joined_text(column)
         
         # Clean text: remove punctuation, numbers, and convert to lowercase
         words = re.findall(r'\b[a-zA-Z]{3,}\b', all_text.lower())
         
-        # Remove common stop words
-        stop_words = {'the', 'and', 'of', 'in', 'to', 'a', 'for', 'with', 'on', 'by', 
-                     'as', 'an', 'from', 'that', 'this', 'is', 'are', 'was', 'were', 
-                     'be', 'has', 'have', 'had', 'but', 'not', 'at', 'which', 'or', 
-                     'it', 'its', 'their', 'they', 'them', 'these', 'those', 'such'}
+        # Get word frequencies
+        word_freq = Counter(words)
         
-        filtered_words = [word for word in words if word not in stop_words]
+        # Remove common stop words from the unique words rather than from every token
+        for word in STOP_WORDS:
+            word_freq.pop(word, None)
         
-        # Get word frequencies
-        word_freq = Counter(filtered_words)
+        self._word_counts[column] = word_freq
         top_words = dict(word_freq.most_common(top_n))
         
         return top_words
     
+    @_cached
     def create_wordcloud(self, column='title'):
         """
         Generate a word cloud from titles or abstracts
@@ -151,7 +331,9 @@ class CORD19Analyzer:
             print("Please clean data first")
             return None
         
-        text = ' '.join(self.df_clean[column].dropna().astype(str))
+        from wordcloud import WordCloud
+        
+        text = self._joined_text(column)
         
         wordcloud = WordCloud(
             width=800, 
@@ -162,7 +344,7 @@ class CORD19Analyzer:
         
         return wordcloud
     
-    def analyze_sources(self):
+    def analyze_sources(self, top_n=10):
         """
         Analyze paper distribution by source
         """
@@ -170,13 +352,18 @@ class CORD19Analyzer:
             print("Please clean data first")
             return None
         
-        source_distribution = self.df_clean['source_x'].value_counts().head(10)
+        if self._source_counts is None:
+            self._source_counts = self.df_clean['source_x'].value_counts()
+        
+        source_distribution = self._source_counts.head(top_n)
         return source_distribution
 
 def create_visualizations(analyzer):
     """
     Create all required visualizations
     """
+    import matplotlib.pyplot as plt
+    
     fig, axes = plt.subplots(2, 2, figsize=(15, 12))
     
     # 1. Publications over time
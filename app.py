@@ -1,12 +1,8 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from analysis import CORD19Analyzer, create_visualizations
+import numpy as np
+from analysis import CORD19Analyzer
 import plotly.express as px
-import plotly.graph_objects as go
-from wordcloud import WordCloud
-import io
 
 # Page configuration
 st.set_page_config(
@@ -34,6 +30,59 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Filtered frames can be nearly as large as the full dataset, so keep only a few selections cached
+CACHE_MAX_ENTRIES = 8
+
+@st.cache_resource(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def apply_filters(_df_clean, data_version, year_range, selected_journals, selected_sources):
+    """
+    Filter the cleaned data by the sidebar selections, cached per data version and selection
+    
+    The cached frame is returned as is rather than copied on every rerun,
+    so callers must treat it as read-only.
+    """
+    # Build one combined mask and index the frame once
+    # Missing years become NaN, which falls outside any range
+    years = _df_clean['publication_year'].to_numpy(dtype='float64', na_value=np.nan)
+    mask = (years >= year_range[0]) & (years <= year_range[1])
+    
+    # Filter by journal
+    if selected_journals:
+        mask &= _df_clean['journal_clean'].isin(selected_journals).to_numpy()
+    
+    # Filter by source
+    if selected_sources:
+        mask &= _df_clean['source_x'].isin(selected_sources).to_numpy()
+    
+    filtered_df = _df_clean.iloc[np.flatnonzero(mask)]
+    
+    return filtered_df
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def count_monthly_publications(_filtered_df, data_version, year_range, selected_journals, selected_sources):
+    """
+    Count filtered papers per publication month, cached per data version and selection
+    """
+    monthly_counts = _filtered_df['publish_time'].dt.to_period('M').value_counts().sort_index()
+    monthly_counts.index = monthly_counts.index.astype(str)
+    return monthly_counts
+
+@st.cache_resource(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def build_wordcloud(_filtered_df, data_version, year_range, selected_journals, selected_sources):
+    """
+    Generate a word cloud of the filtered titles, cached per data version and selection
+    
+    The joined titles are only kept while the cloud is built. Returns None
+    when there is no title text.
+    """
+    text_data = _filtered_df['title'].dropna().str.cat(sep=' ')
+    if not text_data or text_data.isspace():
+        return None
+    
+    from wordcloud import WordCloud
+    
+    return WordCloud(width=800, height=400, background_color='white').generate(text_data)
+
 def main():
     # Header
     st.markdown('<div class="main-header">🔬 CORD-19 COVID-19 Research Data Explorer</div>', 
@@ -51,7 +100,13 @@ def main():
         # Load and clean data
         with st.spinner('Loading data... This may take a moment for large datasets.'):
             if st.session_state.analyzer.load_data():
-                st.session_state.analyzer.clean_data()
+                df_clean = st.session_state.analyzer.clean_data()
+                
+                # Sidebar options only depend on the full dataset, so compute them once
+                st.session_state.top_journal_options = (
+                    st.session_state.analyzer.analyze_top_journals(20).index.tolist()
+                )
+                st.session_state.source_options = df_clean['source_x'].cat.categories.tolist()
                 st.success('Data loaded and cleaned successfully!')
             else:
                 st.error('Error loading data. Please check if metadata.csv is in the data folder.')
@@ -77,16 +132,16 @@ def main():
     
     # Journal filter
     st.sidebar.markdown("### Journal Filter")
-    top_journals = analyzer.analyze_top_journals(20)
+    top_journals = st.session_state.top_journal_options
     selected_journals = st.sidebar.multiselect(
         "Select journals to include:",
-        options=top_journals.index.tolist(),
-        default=top_journals.index.tolist()[:5]
+        options=top_journals,
+        default=top_journals[:5]
     )
     
     # Source filter
     st.sidebar.markdown("### Source Filter")
-    sources = df_clean['source_x'].dropna().unique().tolist()
+    sources = st.session_state.source_options
     selected_sources = st.sidebar.multiselect(
         "Select sources to include:",
         options=sources,
@@ -94,21 +149,9 @@ def main():
     )
     
     # Apply filters
-    filtered_df = df_clean.copy()
-    
-    # Filter by year
-    filtered_df = filtered_df[
-        (filtered_df['publication_year'] >= year_range[0]) & 
-        (filtered_df['publication_year'] <= year_range[1])
-    ]
-    
-    # Filter by journal
-    if selected_journals:
-        filtered_df = filtered_df[filtered_df['journal_clean'].isin(selected_journals)]
-    
-    # Filter by source
-    if selected_sources:
-        filtered_df = filtered_df[filtered_df['source_x'].isin(selected_sources)]
+    # Streamlit caches are shared across sessions, so the key includes the data version
+    filter_key = (analyzer.data_version, year_range, tuple(selected_journals), tuple(selected_sources))
+    filtered_df = apply_filters(df_clean, *filter_key)
     
     # Main content tabs
     tab1, tab2, tab3, tab4 = st.tabs([
@@ -161,6 +204,8 @@ def main():
         with col1:
             # Top journals chart
             top_journals_filtered = filtered_df['journal_clean'].value_counts().head(10)
+            # Categorical value_counts also lists journals with no papers after filtering
+            top_journals_filtered = top_journals_filtered[top_journals_filtered > 0]
             fig_journals = px.bar(
                 x=top_journals_filtered.values,
                 y=top_journals_filtered.index,
@@ -173,6 +218,7 @@ def main():
         with col2:
             # Source distribution
             source_dist = filtered_df['source_x'].value_counts().head(10)
+            source_dist = source_dist[source_dist > 0]
             fig_source = px.pie(
                 values=source_dist.values,
                 names=source_dist.index,
@@ -184,12 +230,9 @@ def main():
         st.markdown('<div class="section-header">Monthly Publication Trends</div>', 
                     unsafe_allow_html=True)
         
-        monthly_data = filtered_df.copy()
-        monthly_data['publish_month'] = monthly_data['publish_time'].dt.to_period('M')
-        monthly_counts = monthly_data['publish_month'].value_counts().sort_index()
+        monthly_counts = count_monthly_publications(filtered_df, *filter_key)
         
         if len(monthly_counts) > 0:
-            monthly_counts.index = monthly_counts.index.astype(str)
             fig_monthly = px.line(
                 x=monthly_counts.index,
                 y=monthly_counts.values,
@@ -207,9 +250,10 @@ def main():
         st.subheader("Word Cloud of Paper Titles")
         
         # Create word cloud
-        text_data = ' '.join(filtered_df['title'].dropna().astype(str))
-        if text_data.strip():
-            wordcloud = WordCloud(width=800, height=400, background_color='white').generate(text_data)
+        wordcloud = build_wordcloud(filtered_df, *filter_key)
+        if wordcloud is not None:
+            # Only needed when there is text to draw, so import here
+            import matplotlib.pyplot as plt
             
             fig, ax = plt.subplots(figsize=(10, 5))
             ax.imshow(wordcloud, interpolation='bilinear')
@@ -238,8 +282,10 @@ def main():
         
         with col2:
             # Abstract words (if available)
-            abstract_text = ' '.join(filtered_df['abstract'].dropna().astype(str))
-            if len(abstract_text) > 100:  # Only show if we have substantial abstract data
+            # Only show if we have substantial abstract data; the lengths are summed
+            # rather than joining every abstract just to measure it
+            abstract_chars = filtered_df['abstract'].str.len().sum()
+            if abstract_chars > 100:
                 abstract_words = analyzer.analyze_word_frequencies('abstract', 15)
                 if abstract_words:
                     fig_abstract_words = px.bar(
@@ -270,20 +316,22 @@ def main():
         # Data summary
         st.subheader("Data Summary")
         
+        # One null scan serves both the column information and the missing values summary
+        missing_data = filtered_df.isnull().sum()
+        
         col1, col2 = st.columns(2)
         
         with col1:
             st.write("**Column Information:**")
             col_info = pd.DataFrame({
                 'Column': filtered_df.columns,
-                'Non-Null Count': filtered_df.notnull().sum(),
+                'Non-Null Count': len(filtered_df) - missing_data,
                 'Data Type': filtered_df.dtypes
             })
             st.dataframe(col_info, use_container_width=True)
         
         with col2:
             st.write("**Missing Values Summary:**")
-            missing_data = filtered_df.isnull().sum()
             missing_percent = (missing_data / len(filtered_df)) * 100
             missing_df = pd.DataFrame({
                 'Missing Count': missing_data,